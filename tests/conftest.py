@@ -0,0 +1,51 @@
+"""
+Shared pytest fixtures.
+
+Session-scoped fixtures here are computed once per test run.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from typing import Set, Tuple
+
+# Top-level directories scanned by the existing_paths fixture
+SCANNED_DIRS = ("src", "tests", "docker", "docs")
+
+
+def _scan_tree(root: Path, top: str, dirs: Set[str], files: Set[str]) -> None:
+    """Collect relative directory and file paths under root/top."""
+    with os.scandir(root / top) as entries:
+        for entry in entries:
+            rel_path = f"{top}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "__pycache__":
+                    continue
+                dirs.add(rel_path)
+                _scan_tree(root, rel_path, dirs, files)
+            else:
+                files.add(rel_path)
+
+
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    """Get project root directory."""
+    return Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def existing_paths(project_root: Path) -> Tuple[Set[str], Set[str]]:
+    """Get (directories, files) under the scanned top-level directories.
+
+    Paths are relative to the project root and use forward slashes. The tree
+    is read once with os.scandir so structure tests can check membership
+    instead of issuing one stat call per path.
+    """
+    dirs: Set[str] = set()
+    files: Set[str] = set()
+    for top in SCANNED_DIRS:
+        if not (project_root / top).is_dir():
+            continue
+        dirs.add(top)
+        _scan_tree(project_root, top, dirs, files)
+    return dirs, files